@@ -4,15 +4,38 @@ Flask web application for displaying Wikipedia category word clouds.
 """
 
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+from celery import Celery
+from celery.result import AsyncResult
+import orjson
+import math
 import os
 import sys
-from wiki_category_analysis import analyze_category
+from wiki_category_analysis import get_top_words
 
 # Add the templates directory to the Python path so we can import the color_palette module
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates"))
-from color_palette import get_palette, PALETTES
+from color_palette import get_palette, get_color_cycle, PALETTES
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes responses with orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Celery task queue used to run category analyses outside the web worker
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
+celery = Celery('wiki', broker=CELERY_BROKER_URL, backend=CELERY_RESULT_BACKEND)
+
+# Words seen fewer times than this are left out of the word cloud
+MIN_WORD_COUNT = 3
 
 @app.route('/')
 def index():
@@ -20,9 +43,35 @@ def index():
     # Pass the available color palettes to the template
     return render_template('index.html', palettes=list(PALETTES.keys()))
 
+@celery.task(name='analyze_task')
+def analyze_task(category, palette_name):
+    """Analyze a Wikipedia category and build the word cloud response payload."""
+    # Get the selected color palette
+    palette = get_palette(palette_name)
+    
+    # Analyze the category using the existing script
+    top_words = get_top_words(category, 100)
+    
+    # Convert to format suitable for word cloud
+    # Format: [{"text": "word", "size": log-scaled frequency, "color": "#hex"}, ...]
+    # Only relative sizes matter, so frequencies are compressed to a log scale
+    color_cycle = get_color_cycle(palette_name)
+    word_cloud_data = [
+        {"text": word, "size": int(math.log2(count + 1) * 16), "color": color_cycle[i]}
+        for i, (word, count) in enumerate(top_words)
+        if count >= MIN_WORD_COUNT
+    ]
+    
+    return {
+        'category': category,
+        'palette': palette_name,
+        'colors': palette,
+        'wordCloudData': word_cloud_data
+    }
+
 @app.route('/analyze', methods=['POST'])
 def analyze():
-    """Analyze a Wikipedia category and return word frequencies."""
+    """Queue the analysis of a Wikipedia category and return its job id."""
     category = request.form.get('category', '')
     palette_name = request.form.get('palette', 'default')
     
@@ -30,32 +79,25 @@ def analyze():
         return jsonify({'error': 'Category name is required'}), 400
     
     try:
-        # Get the selected color palette
-        palette = get_palette(palette_name)
-        
-        # Analyze the category using the existing script
-        word_count = analyze_category(category)
-        
-        # Convert to format suitable for word cloud
-        # Format: [{"text": "word", "size": frequency, "color": "#hex"}, ...]
-        word_cloud_data = []
-        for i, (word, count) in enumerate(word_count.most_common(100)):
-            word_cloud_data.append({
-                "text": word,
-                "size": count,
-                "color": palette[i]  # Assign a color from the palette
-            })
-        
-        return jsonify({
-            'category': category,
-            'palette': palette_name,
-            'colors': palette.get_colors(),
-            'wordCount': dict(word_count),
-            'wordCloudData': word_cloud_data
-        })
+        job = analyze_task.delay(category, palette_name)
+        return jsonify({'job_id': job.id}), 202
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/status/<job_id>')
+def status(job_id):
+    """Report the state of a queued analysis, including its result once finished."""
+    job = AsyncResult(job_id, app=celery)
+    
+    if job.state == 'FAILURE':
+        return jsonify({'job_id': job_id, 'state': job.state, 'error': str(job.result)}), 500
+    
+    response = {'job_id': job_id, 'state': job.state}
+    if job.state == 'SUCCESS':
+        response['result'] = job.result
+    
+    return jsonify(response)
+
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
     os.makedirs('templates', exist_ok=True)
@@ -63,4 +105,13 @@ if __name__ == '__main__':
     # Create static directory if it doesn't exist
     os.makedirs('static', exist_ok=True)
     
-    app.run(debug=True)
\ No newline at end of file
+    # Listen on localhost only unless FLASK_RUN_HOST says otherwise (e.g. 0.0.0.0)
+    host = os.environ.get('FLASK_RUN_HOST', '127.0.0.1')
+    
+    # Use one process per core where processes can be forked: analyses mix
+    # network I/O with GIL-bound tokenization, so threads alone serialize
+    # concurrent requests. Windows has no fork, so fall back to threads there.
+    if hasattr(os, 'fork'):
+        app.run(host=host, processes=os.cpu_count() or 1, threaded=False)
+    else:
+        app.run(host=host, threaded=True)
\ No newline at end of file
@@ -5,6 +5,10 @@ document.addEventListener('DOMContentLoaded', function() {
     const resultTitle = document.getElementById('result-title');
     const wordCloudDiv = document.getElementById('word-cloud');
     
+    // Poll the job status every 2 seconds for at most 10 minutes
+    const POLL_INTERVAL = 2000;
+    const MAX_POLL_ATTEMPTS = 300;
+    
     form.addEventListener('submit', function(e) {
         e.preventDefault();
         
@@ -29,6 +33,7 @@ document.addEventListener('DOMContentLoaded', function() {
             }
             return response.json();
         })
+        .then(data => pollStatus(data.job_id))
         .then(data => {
             // Hide loading indicator
             loadingDiv.classList.add('hidden');
@@ -49,6 +54,28 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     });
     
+    function pollStatus(jobId, attempt = 1) {
+        // Poll the job status until the analysis has finished or we give up
+        if (attempt > MAX_POLL_ATTEMPTS) {
+            return Promise.reject(new Error('The analysis did not finish in time. Please try again later.'));
+        }
+        
+        return fetch(`/status/${jobId}`)
+            .then(response => response.json().then(data => {
+                if (!response.ok) {
+                    throw new Error(data.error || 'An error occurred');
+                }
+                return data;
+            }))
+            .then(data => {
+                if (data.state === 'SUCCESS') {
+                    return data.result;
+                }
+                return new Promise(resolve => setTimeout(resolve, POLL_INTERVAL))
+                    .then(() => pollStatus(jobId, attempt + 1));
+            });
+    }
+    
     function generateWordCloud(words) {
         // Clear previous word cloud
         wordCloudDiv.innerHTML = '';
@@ -1,157 +1,113 @@
 #!/usr/bin/env python3
 """
 Color Palette module for Wikipedia Word Cloud visualization.
-Provides a base ColorPalette class and several common color palettes.
+Provides several common color palettes as tuples of hex color codes.
 """
 
-class ColorPalette:
-    """
-    Base class for color palettes.
-    Each palette contains 6 hex color codes.
-    """
-    
-    def __init__(self, colors=None):
-        """
-        Initialize a color palette with 6 colors.
-        
-        Args:
-            colors (list): List of 6 hex color codes. If None, uses default colors.
-        """
-        if colors and len(colors) == 6:
-            self.colors = colors
-        else:
-            # Default to a grayscale palette if no colors provided
-            self.colors = ["#000000", "#333333", "#666666", "#999999", "#CCCCCC", "#FFFFFF"]
-    
-    def get_colors(self):
-        """Return the list of colors in the palette."""
-        return self.colors
-    
-    def get_color(self, index):
-        """
-        Get a specific color by index (with wrapping).
-        
-        Args:
-            index (int): Index of the color to retrieve
-            
-        Returns:
-            str: Hex color code
-        """
-        return self.colors[index % len(self.colors)]
-    
-    def __iter__(self):
-        """Make the palette iterable."""
-        return iter(self.colors)
-    
-    def __getitem__(self, index):
-        """Allow indexing to get colors."""
-        return self.get_color(index)
-
-
-class MaterialPalette(ColorPalette):
-    """Google Material Design color palette."""
-    
-    def __init__(self):
-        super().__init__([
-            "#F44336",  # Red
-            "#2196F3",  # Blue
-            "#4CAF50",  # Green
-            "#FFC107",  # Amber
-            "#9C27B0",  # Purple
-            "#FF9800",  # Orange
-        ])
-
-
-class PastelPalette(ColorPalette):
-    """Soft pastel color palette."""
-    
-    def __init__(self):
-        super().__init__([
-            "#FFB3BA",  # Pastel Red
-            "#FFDFBA",  # Pastel Orange
-            "#FFFFBA",  # Pastel Yellow
-            "#BAFFC9",  # Pastel Green
-            "#BAE1FF",  # Pastel Blue
-            "#E2BAFF",  # Pastel Purple
-        ])
+import functools
 
+# Number of colors precomputed in each palette's color cycle (one per word cloud word)
+CYCLE_LENGTH = 100
 
-class VibrantPalette(ColorPalette):
-    """Vibrant color palette."""
-    
-    def __init__(self):
-        super().__init__([
-            "#FF1744",  # Vibrant Red
-            "#00E676",  # Vibrant Green
-            "#2979FF",  # Vibrant Blue
-            "#FFEA00",  # Vibrant Yellow
-            "#D500F9",  # Vibrant Purple
-            "#FF9100",  # Vibrant Orange
-        ])
-
+# Grayscale palette used when no palette (or an unknown one) is requested
+DEFAULT_PALETTE = ("#000000", "#333333", "#666666", "#999999", "#CCCCCC", "#FFFFFF")
 
-class EarthtonePalette(ColorPalette):
-    """Earthy, natural color palette."""
-    
-    def __init__(self):
-        super().__init__([
-            "#795548",  # Brown
-            "#8D6E63",  # Light Brown
-            "#A1887F",  # Tan
-            "#BCAAA4",  # Light Tan
-            "#D7CCC8",  # Beige
-            "#EFEBE9",  # Off-White
-        ])
+# Dictionary of available palettes for easy access.
+# Each palette is a tuple of 6 hex color codes.
+PALETTES = {
+    "default": DEFAULT_PALETTE,
+    # Google Material Design color palette
+    "material": (
+        "#F44336",  # Red
+        "#2196F3",  # Blue
+        "#4CAF50",  # Green
+        "#FFC107",  # Amber
+        "#9C27B0",  # Purple
+        "#FF9800",  # Orange
+    ),
+    # Soft pastel color palette
+    "pastel": (
+        "#FFB3BA",  # Pastel Red
+        "#FFDFBA",  # Pastel Orange
+        "#FFFFBA",  # Pastel Yellow
+        "#BAFFC9",  # Pastel Green
+        "#BAE1FF",  # Pastel Blue
+        "#E2BAFF",  # Pastel Purple
+    ),
+    # Vibrant color palette
+    "vibrant": (
+        "#FF1744",  # Vibrant Red
+        "#00E676",  # Vibrant Green
+        "#2979FF",  # Vibrant Blue
+        "#FFEA00",  # Vibrant Yellow
+        "#D500F9",  # Vibrant Purple
+        "#FF9100",  # Vibrant Orange
+    ),
+    # Earthy, natural color palette
+    "earthy": (
+        "#795548",  # Brown
+        "#8D6E63",  # Light Brown
+        "#A1887F",  # Tan
+        "#BCAAA4",  # Light Tan
+        "#D7CCC8",  # Beige
+        "#EFEBE9",  # Off-White
+    ),
+    # Ocean-inspired color palette
+    "ocean": (
+        "#01579B",  # Deep Blue
+        "#0288D1",  # Ocean Blue
+        "#29B6F6",  # Sky Blue
+        "#81D4FA",  # Light Blue
+        "#B3E5FC",  # Very Light Blue
+        "#E1F5FE",  # Almost White Blue
+    ),
+    # Sunset-inspired color palette
+    "sunset": (
+        "#FF6F00",  # Deep Orange
+        "#FF9800",  # Orange
+        "#FFC107",  # Amber
+        "#FFEB3B",  # Yellow
+        "#FFF176",  # Light Yellow
+        "#FFF9C4",  # Very Light Yellow
+    ),
+}
 
 
-class OceanPalette(ColorPalette):
-    """Ocean-inspired color palette."""
+def get_palette(name="default"):
+    """
+    Get a color palette by name.
     
-    def __init__(self):
-        super().__init__([
-            "#01579B",  # Deep Blue
-            "#0288D1",  # Ocean Blue
-            "#29B6F6",  # Sky Blue
-            "#81D4FA",  # Light Blue
-            "#B3E5FC",  # Very Light Blue
-            "#E1F5FE",  # Almost White Blue
-        ])
+    Args:
+        name (str): Name of the palette to retrieve
+        
+    Returns:
+        tuple: The requested palette's hex color codes
+    """
+    return PALETTES.get(name.lower(), DEFAULT_PALETTE)
 
 
-class SunsetPalette(ColorPalette):
-    """Sunset-inspired color palette."""
+@functools.lru_cache(maxsize=None)
+def build_color_cycle(palette):
+    """
+    Repeat a palette's colors to CYCLE_LENGTH entries.
     
-    def __init__(self):
-        super().__init__([
-            "#FF6F00",  # Deep Orange
-            "#FF9800",  # Orange
-            "#FFC107",  # Amber
-            "#FFEB3B",  # Yellow
-            "#FFF176",  # Light Yellow
-            "#FFF9C4",  # Very Light Yellow
-        ])
-
-
-# Dictionary of available palettes for easy access
-PALETTES = {
-    "default": ColorPalette(),
-    "material": MaterialPalette(),
-    "pastel": PastelPalette(),
-    "vibrant": VibrantPalette(),
-    "earthy": EarthtonePalette(),
-    "ocean": OceanPalette(),
-    "sunset": SunsetPalette(),
-}
+    Args:
+        palette (tuple): Hex color codes of the palette
+        
+    Returns:
+        tuple: CYCLE_LENGTH hex color codes cycling through the palette
+    """
+    return tuple(palette[i % len(palette)] for i in range(CYCLE_LENGTH))
 
 
-def get_palette(name="default"):
+def get_color_cycle(name="default"):
     """
-    Get a color palette by name.
+    Get a palette's colors repeated to CYCLE_LENGTH entries, for plain tuple indexing.
     
     Args:
-        name (str): Name of the palette to retrieve
+        name (str): Name of the palette
         
     Returns:
-        ColorPalette: The requested color palette
+        tuple: CYCLE_LENGTH hex color codes cycling through the palette
     """
-    return PALETTES.get(name.lower(), ColorPalette())
\ No newline at end of file
+    return build_color_cycle(get_palette(name))
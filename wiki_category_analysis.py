@@ -8,45 +8,265 @@ the cumulative frequency of non-common words across all pages.
 """
 
 import argparse
-import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from collections import Counter
-import string
+from collections import Counter, deque
 import time
 import os
-import json
+import orjson
+import gzip
 import hashlib
+import tempfile
+import functools
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Download NLTK resources if not already downloaded
 try:
-    nltk.data.find('tokenizers/punkt')
     nltk.data.find('corpora/stopwords')
 except LookupError:
-    nltk.download('punkt')
     nltk.download('stopwords')
 
+# Words of three or more letters; punctuation, digits and short words never match
+TOKEN_RE = re.compile(r"[^\W\d_]{3,}")
+
+# Common words to ignore: English stopwords plus words specific to Wikipedia
+STOP_WORDS = frozenset(stopwords.words('english')) | {
+    'cite', 'reference', 'http', 'https', 'www', 'com', 'org',
+    'retrieved', 'isbn', 'doi', 'page', 'pages', 'website', 'link'
+}
+
 # Cache directory
 CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
 os.makedirs(CACHE_DIR, exist_ok=True)
 
-def get_cache_path(category_name):
+# Per-page extracts and category member lists are cached separately
+PAGE_CACHE_DIR = os.path.join(CACHE_DIR, "pages")
+CATEGORY_CACHE_DIR = os.path.join(CACHE_DIR, "categories")
+os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+os.makedirs(CATEGORY_CACHE_DIR, exist_ok=True)
+
+# Age in seconds after which cached pages and category lists are fetched again
+PAGE_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# HTTP response cache; expired responses are revalidated with ETag/Last-Modified
+HTTP_CACHE_PATH = os.path.join(CACHE_DIR, "wiki_http_cache")
+HTTP_CACHE_EXPIRE = 24 * 60 * 60
+
+# Number of pages fetched concurrently
+MAX_WORKERS = 16
+
+# Pages fetched ahead of the counting loop; bounds how many extracts are held in memory
+MAX_PAGES_IN_FLIGHT = MAX_WORKERS * 2
+
+# Wikipedia API request budget shared by all fetch threads
+REQUESTS_PER_SECOND = 200
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often the API may be called.
+    """
+    
+    def __init__(self, rate):
+        """
+        Initialize a token bucket that refills at the given rate.
+        
+        Args:
+            rate (float): Number of calls allowed per second
+        """
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a call is allowed by the rate limit."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve a token now; go into debt and sleep it off if none is left
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if delay:
+            time.sleep(delay)
+
+api_rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    Transport adapter that waits for the shared rate limiter before each request.
+    
+    Responses served from the HTTP cache never reach the adapter, so only
+    requests that actually go out to the network are throttled.
+    """
+    
+    def send(self, request, **kwargs):
+        api_rate_limiter.acquire()
+        return super().send(request, **kwargs)
+
+class WikipediaAPIError(Exception):
+    """
+    Raised when the MediaWiki API answers a query with an error.
+    
+    The API reports errors such as rate limiting in the body of an HTTP 200
+    response, so they have to be checked for explicitly.
+    """
+
+def check_api_response(data):
     """
-    Generate a cache file path for a category using MD5 hash.
+    Raise WikipediaAPIError if an API response body reports an error.
     
     Args:
-        category_name (str): Name of the Wikipedia category
+        data (dict): Decoded JSON body of the API response
+        
+    Returns:
+        dict: The same response body
+    """
+    if "error" in data:
+        error = data["error"]
+        raise WikipediaAPIError(f"{error.get('code', 'unknown')}: {error.get('info', '')}")
+    
+    return data
+
+def is_cacheable_response(response):
+    """
+    Check whether an API response may be stored in the HTTP cache.
+    
+    Only category member listings are cached: page extracts are already kept
+    in the page cache for much longer, so storing them again would only grow
+    the HTTP cache with every page ever fetched.
+    
+    Args:
+        response (requests.Response): Response from the API
+        
+    Returns:
+        bool: True for successful category member responses
+    """
+    if "list=categorymembers" not in response.url:
+        return False
+    
+    # Quotes inside JSON strings are escaped, so this only matches an "error" key
+    return b'"error":' not in response.content
+
+# Identify the client so Wikipedia applies its regular API limits
+USER_AGENT = "wiki-wordcloud/1.0 (https://github.com/Yashasvi-Khatri/wikipedia_analysis)"
+
+def create_api_session():
+    """
+    Create the HTTP session shared by all Wikipedia API calls of a process.
+    
+    The session keeps connections alive in a pool large enough for every
+    fetch thread, retries transient failures, caches category listings and
+    rate-limits every request that is not answered from the cache.
+    
+    Returns:
+        requests_cache.CachedSession: Session to use for API requests
+    """
+    session = requests_cache.CachedSession(
+        HTTP_CACHE_PATH,
+        backend='sqlite',
+        expire_after=HTTP_CACHE_EXPIRE,
+        filter_fn=is_cacheable_response
+    )
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': 'gzip'
+    })
+    
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = RateLimitedAdapter(pool_connections=MAX_WORKERS * 2, pool_maxsize=MAX_WORKERS * 2,
+                                 max_retries=retry)
+    session.mount('https://', adapter)
+    
+    # Drop expired entries so listings of categories no longer requested don't pile up
+    session.cache.delete(expired=True)
+    
+    return session
+
+# API sessions by process id, created on first use (see get_api_session)
+api_sessions = {}
+api_sessions_lock = threading.Lock()
+
+def get_api_session():
+    """
+    Get the API session of the current process, creating it on first use.
+    
+    The session holds an open SQLite connection for the HTTP cache, which
+    must not be carried across fork(). Creating it lazily per process gives
+    every forked worker (e.g. Celery prefork children) its own connection.
+    
+    Returns:
+        requests_cache.CachedSession: Session to use for API requests
+    """
+    pid = os.getpid()
+    
+    with api_sessions_lock:
+        if pid not in api_sessions:
+            api_sessions[pid] = create_api_session()
+        return api_sessions[pid]
+
+def get_cache_path(category_name, cache_dir=CACHE_DIR, extension="json"):
+    """
+    Generate a cache file path for a category using a BLAKE2b hash.
+    
+    Args:
+        category_name (str): Name of the Wikipedia category (or page)
+        cache_dir (str): Directory holding the cache file
+        extension (str): File extension of the cache file
         
     Returns:
         str: Path to the cache file
     """
-    # Create MD5 hash of the category name
-    hash_obj = hashlib.md5(category_name.encode())
+    # Create a 128-bit BLAKE2b hash of the category name (same length as MD5)
+    hash_obj = hashlib.blake2b(category_name.encode(), digest_size=16)
     hash_str = hash_obj.hexdigest()
     
-    return os.path.join(CACHE_DIR, f"{hash_str}.json")
+    return os.path.join(cache_dir, f"{hash_str}.{extension}")
+
+def is_cache_fresh(cache_path):
+    """
+    Check whether a page or category cache file exists and is recent enough.
+    
+    Args:
+        cache_path (str): Path to the cache file
+        
+    Returns:
+        bool: True if the file is younger than PAGE_CACHE_MAX_AGE
+    """
+    try:
+        return time.time() - os.path.getmtime(cache_path) < PAGE_CACHE_MAX_AGE
+    except OSError:
+        return False
+
+def write_cache_file(cache_path, data):
+    """
+    Write a cache file atomically.
+    
+    The data goes to a temporary file in the same directory which is then
+    renamed over the cache file, so a crash or a concurrent writer never
+    leaves a truncated file behind.
+    
+    Args:
+        cache_path (str): Path to the cache file
+        data (bytes): Content of the cache file
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+    
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
 
 def load_from_cache(category_name):
     """
@@ -62,10 +282,10 @@ def load_from_cache(category_name):
     
     if os.path.exists(cache_path):
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(cache_path, 'rb') as f:
+                data = orjson.loads(f.read())
                 return Counter(data), True
-        except (json.JSONDecodeError, IOError) as e:
+        except (orjson.JSONDecodeError, IOError) as e:
             print(f"Error loading cache: {e}")
     
     return Counter(), False
@@ -81,21 +301,93 @@ def save_to_cache(category_name, word_count):
     cache_path = get_cache_path(category_name)
     
     try:
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(dict(word_count), f, ensure_ascii=False, indent=2)
+        write_cache_file(cache_path, orjson.dumps(word_count))
         print(f"Results cached to {cache_path}")
     except IOError as e:
         print(f"Error saving to cache: {e}")
 
-def get_pages_in_category(category_name):
+def load_page_from_cache(page_title):
+    """
+    Load the text content of a page from the page cache if available.
+    
+    An unreadable cache file (e.g. a truncated one) is treated as a cache miss.
+    
+    Args:
+        page_title (str): Title of the Wikipedia page
+        
+    Returns:
+        tuple: (Text content of the page, bool indicating if cache was used)
+    """
+    cache_path = get_cache_path(page_title, PAGE_CACHE_DIR, "txt.gz")
+    
+    if is_cache_fresh(cache_path):
+        try:
+            with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                return f.read(), True
+        except (EOFError, IOError, UnicodeDecodeError) as e:
+            print(f"Error loading page cache: {e}")
+    
+    return "", False
+
+def save_page_to_cache(page_title, content):
+    """
+    Save the text content of a page to the page cache.
+    
+    Args:
+        page_title (str): Title of the Wikipedia page
+        content (str): Text content of the page
+    """
+    cache_path = get_cache_path(page_title, PAGE_CACHE_DIR, "txt.gz")
+    
+    try:
+        write_cache_file(cache_path, gzip.compress(content.encode('utf-8')))
+    except IOError as e:
+        print(f"Error saving page cache: {e}")
+
+def get_pages_in_category_cached(category_name, session=None):
+    """
+    Get all pages in a Wikipedia category, using the category cache when fresh.
+    
+    Args:
+        category_name (str): Name of the Wikipedia category
+        session (requests.Session): Optional session (defaults to get_api_session())
+        
+    Returns:
+        list: List of page titles in the category
+    """
+    cache_path = get_cache_path(category_name, CATEGORY_CACHE_DIR, "json.gz")
+    
+    if is_cache_fresh(cache_path):
+        try:
+            with gzip.open(cache_path, 'rb') as f:
+                pages = orjson.loads(f.read())
+            print(f"Loaded {len(pages)} pages from cache for category '{category_name}'")
+            return pages
+        except (orjson.JSONDecodeError, EOFError, IOError) as e:
+            print(f"Error loading category cache: {e}")
+    
+    pages = get_pages_in_category(category_name, session)
+    
+    try:
+        write_cache_file(cache_path, gzip.compress(orjson.dumps(pages)))
+    except IOError as e:
+        print(f"Error saving category cache: {e}")
+    
+    return pages
+
+def get_pages_in_category(category_name, session=None):
     """
     Get all pages in a given Wikipedia category using the MediaWiki API.
     
     Args:
         category_name (str): Name of the Wikipedia category
+        session (requests.Session): Optional session (defaults to get_api_session())
         
     Returns:
         list: List of page titles in the category
+        
+    Raises:
+        WikipediaAPIError: If the API returned an error
     """
     api_url = "https://en.wikipedia.org/w/api.php"
     
@@ -103,6 +395,7 @@ def get_pages_in_category(category_name):
     if not category_name.startswith("Category:"):
         category_name = "Category:" + category_name
     
+    session = session or get_api_session()
     pages = []
     cmcontinue = None
     
@@ -119,8 +412,8 @@ def get_pages_in_category(category_name):
         if cmcontinue:
             params["cmcontinue"] = cmcontinue
         
-        response = requests.get(api_url, params=params)
-        data = response.json()
+        response = session.get(api_url, params=params)
+        data = check_api_response(response.json())
         
         if "query" in data and "categorymembers" in data["query"]:
             for member in data["query"]["categorymembers"]:
@@ -128,25 +421,32 @@ def get_pages_in_category(category_name):
         
         if "continue" in data and "cmcontinue" in data["continue"]:
             cmcontinue = data["continue"]["cmcontinue"]
-            # Sleep to avoid hitting API rate limits
-            time.sleep(1)
         else:
             break
     
     print(f"Found {len(pages)} pages in category '{category_name}'")
     return pages
 
-def get_page_content(page_title):
+def get_page_content(page_title, session=None):
     """
     Get the text content of a Wikipedia page using the MediaWiki API.
     
+    Full-page extracts are requested one title at a time: TextExtracts only
+    returns several extracts per query together with exintro, so batching
+    titles would not save any requests.
+    
     Args:
         page_title (str): Title of the Wikipedia page
+        session (requests.Session): Optional session (defaults to get_api_session())
         
     Returns:
-        str: Text content of the page
+        str: Text content of the page, or None if the response did not include the page
+        
+    Raises:
+        WikipediaAPIError: If the API returned an error
     """
     api_url = "https://en.wikipedia.org/w/api.php"
+    session = session or get_api_session()
     
     params = {
         "action": "query",
@@ -157,50 +457,70 @@ def get_page_content(page_title):
         "exsectionformat": "plain"
     }
     
-    response = requests.get(api_url, params=params)
-    data = response.json()
+    response = session.get(api_url, params=params)
+    data = check_api_response(response.json())
     
-    # Extract content from response
+    # Extract content from response; missing pages have an entry without an extract
     if "query" in data and "pages" in data["query"]:
-        pages = data["query"]["pages"]
-        for page_id in pages:
-            if "extract" in pages[page_id]:
-                return pages[page_id]["extract"]
+        for page in data["query"]["pages"].values():
+            return page.get("extract", "")
     
-    return ""
+    return None
 
-def analyze_text(text):
+def get_page_content_cached(page_title, session=None):
     """
-    Analyze text to count frequencies of non-common words.
+    Get the text content of a page, fetching it only if it is not in the page cache.
     
     Args:
-        text (str): Text to analyze
+        page_title (str): Title of the Wikipedia page
+        session (requests.Session): Optional session (defaults to get_api_session())
         
     Returns:
-        Counter: Counter object with word frequencies
+        str: Text content of the page
     """
-    # Convert to lowercase and tokenize
-    text = text.lower()
-    tokens = word_tokenize(text)
+    content, cache_used = load_page_from_cache(page_title)
+    if cache_used:
+        return content
     
-    # Remove punctuation and numbers
-    tokens = [word for word in tokens if word not in string.punctuation and not word.isdigit()]
+    content = get_page_content(page_title, session)
+    if content is None:
+        print(f"No content returned for page '{page_title}'")
+        return ""
     
-    # Remove stopwords (common words)
-    stop_words = set(stopwords.words('english'))
+    # Cache pages without an extract too, so they are not requested again
+    save_page_to_cache(page_title, content)
     
-    # Add additional common words specific to Wikipedia
-    wiki_common_words = [
-        'cite', 'reference', 'http', 'https', 'www', 'com', 'org', 
-        'retrieved', 'isbn', 'doi', 'page', 'pages', 'website', 'link'
-    ]
-    stop_words.update(wiki_common_words)
+    return content
+
+def remove_stop_words(word_count):
+    """
+    Remove stopwords from a word frequency Counter in place.
     
-    # Filter out short words and stopwords
-    meaningful_words = [word for word in tokens if len(word) > 2 and word not in stop_words]
+    Filtering once per distinct word after counting keeps the per-token
+    work inside Counter's C counting loop.
+    
+    Args:
+        word_count (Counter): Counter object with word frequencies
+        
+    Returns:
+        Counter: The same Counter without stopwords
+    """
+    for word in STOP_WORDS.intersection(word_count):
+        del word_count[word]
+    
+    return word_count
+
+def analyze_text(text):
+    """
+    Analyze text to count frequencies of non-common words.
     
-    # Count frequencies
-    return Counter(meaningful_words)
+    Args:
+        text (str): Text to analyze
+        
+    Returns:
+        Counter: Counter object with word frequencies
+    """
+    return remove_stop_words(Counter(TOKEN_RE.findall(text.lower())))
 
 def analyze_category(category):
     """
@@ -223,27 +543,58 @@ def analyze_category(category):
     print(f"Processing category '{category}'...")
     
     # Get all pages in the category
-    pages = get_pages_in_category(category)
+    pages = get_pages_in_category_cached(category)
     
-    # Process each page
-    for i, page_title in enumerate(pages):
-        print(f"Processing page {i+1}/{len(pages)}: {page_title}")
-        
-        # Get page content
-        content = get_page_content(page_title)
+    # Fetch pages concurrently, in category order, at most MAX_PAGES_IN_FLIGHT
+    # pages ahead of the one being counted
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        titles = iter(pages)
+        in_flight = deque()
         
-        # Analyze text and update word count
-        page_word_count = analyze_text(content)
-        word_count.update(page_word_count)
+        for page_title in itertools.islice(titles, MAX_PAGES_IN_FLIGHT):
+            in_flight.append((page_title, executor.submit(get_page_content_cached, page_title)))
         
-        # Sleep to avoid hitting API rate limits
-        time.sleep(0.5)
+        for i in range(len(pages)):
+            page_title, future = in_flight.popleft()
+            content = future.result()
+            
+            # Refill the window before counting so fetching overlaps with counting
+            next_title = next(titles, None)
+            if next_title is not None:
+                in_flight.append((next_title, executor.submit(get_page_content_cached, next_title)))
+            
+            print(f"Processing page {i+1}/{len(pages)}: {page_title}")
+            
+            # Count words straight into the total instead of merging per-page Counters
+            word_count.update(TOKEN_RE.findall(content.lower()))
+    
+    # Drop common words once, after all pages have been counted
+    remove_stop_words(word_count)
     
     # Save results to cache
     save_to_cache(category, word_count)
     
     return word_count
 
+@functools.lru_cache(maxsize=128)
+def get_top_words(category, count=100):
+    """
+    Get the most frequent words of a Wikipedia category.
+    
+    Results are memoized per process, so repeat calls skip the cache file
+    entirely. Only the top words are kept in memory rather than the full
+    Counter, which can hold hundreds of thousands of entries. The returned
+    tuple is shared between callers and must not be modified.
+    
+    Args:
+        category (str): Name of the Wikipedia category
+        count (int): Number of words to return
+        
+    Returns:
+        tuple: (word, frequency) pairs, most frequent first
+    """
+    return tuple(analyze_category(category).most_common(count))
+
 def main():
     """Main function to run the analysis."""
     parser = argparse.ArgumentParser(description='Analyze word frequencies in Wikipedia categories')